@@ -4,33 +4,56 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import json
+import os
 import re
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
-from pathlib import Path
 from typing import Dict, List, Tuple
 from urllib.parse import parse_qs, urlparse
 
-
-SCRIPT_PATH = Path(__file__).resolve()
-REPO_ROOT = SCRIPT_PATH.parents[1]
-WORKSPACE_ROOT = SCRIPT_PATH.parents[2]
-DEFAULT_BMAD_OUTPUT = WORKSPACE_ROOT / "_bmad-output"
-DEFAULT_BMAD = WORKSPACE_ROOT / "_bmad"
-HTML_PATH = REPO_ROOT / "ui-preview" / "bmad-local-dashboard.html"
-
-
-EPIC_KEY_RE = re.compile(r"^epic-(\d+)$")
-STORY_KEY_RE = re.compile(r"^(\d+)-(\d+)-([a-z0-9-]+)$")
-EPIC_TITLE_RE = re.compile(r"^### Epic\s+(\d+):\s*(.+?)\s*$")
-STORY_LINE_RE = re.compile(r"^-\s+(\d+)\.(\d+)\s+(.+?)\s*$")
-STORY_FILE_TITLE_RE = re.compile(r"^# Story\s+\d+\.\d+:\s*(.+?)\s*$")
-STATUS_LINE_RE = re.compile(r"^Status:\s*(.+?)\s*$")
-CHECKBOX_TOTAL_RE = re.compile(r"^- \[(?: |x|X)\]", re.MULTILINE)
-CHECKBOX_DONE_RE = re.compile(r"^- \[(?:x|X)\]", re.MULTILINE)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+SCRIPT_PATH = os.path.realpath(__file__)
+REPO_ROOT = os.path.dirname(os.path.dirname(SCRIPT_PATH))
+WORKSPACE_ROOT = os.path.dirname(REPO_ROOT)
+DEFAULT_BMAD_OUTPUT = os.path.join(WORKSPACE_ROOT, "_bmad-output")
+DEFAULT_BMAD = os.path.join(WORKSPACE_ROOT, "_bmad")
+HTML_PATH = os.path.join(REPO_ROOT, "ui-preview", "bmad-local-dashboard.html")
+
+
+EPIC_KEY_PREFIX = "epic-"
+STORY_SLUG_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789-"
+TITLE_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:### Epic[^\S\n]+(?P<epic>\d+):[^\S\n]*(?P<epic_title>\S(?:.*\S)?)"
+    r"|-[^\S\n]+(?P<story_epic>\d+)\.(?P<story>\d+)[^\S\n]+(?P<story_title>\S(?:.*\S)?))[^\S\n]*$",
+    re.MULTILINE,
+)
+STORY_FILE_TITLE_RE = re.compile(rb"^[ \t]*# Story[ \t]+\d+\.\d+:[ \t]*(\S(?:.*\S)?)\s*$", re.MULTILINE)
+STATUS_LINE_RE = re.compile(rb"^[ \t]*Status:[ \t]*(\S(?:.*\S)?)\s*$", re.MULTILINE)
+SPRINT_BLOCK_RE = re.compile(
+    rb"^[^\S\n]*development_status:[^\S\n]*$\n?((?:^(?:[^\S\n]*(?:#.*)?|  .*)(?:\n|\Z))*)",
+    re.MULTILINE,
+)
+SPRINT_ENTRY_RE = re.compile(rb"^[^\S\n]{2}([a-z0-9-]+):[^\S\n]*([a-z-]+)[^\S\n]*$", re.MULTILINE)
+
+HEADER_SCAN_BYTES = 4096
+PARALLEL_PARSE_MIN_FILES = 8
+PARSE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+BOARD_CACHE_SIZE = 8
+GZIP_LEVEL = 6
+KEEPALIVE_TIMEOUT_SECONDS = 30
 
 
 STORY_STATUS_ORDER = [
@@ -44,6 +67,9 @@ STORY_STATUS_ORDER = [
 EPIC_STATUS_ORDER = ["backlog", "in-progress", "done", "optional"]
 
 
+_PARSE_EXECUTOR = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="bmad-parse")
+
+
 @dataclass
 class ParsedStoryFile:
     title: str | None
@@ -53,19 +79,37 @@ class ParsedStoryFile:
     updated_at: str | None
 
 
+@dataclass
+class CachedBoard:
+    content: bytes
+    gzip_content: bytes
+
+
 def now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
-def read_text(path: Path) -> str:
+def encode_json(payload: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            # e.g. story numbers beyond 64 bits, which the stdlib encoder handles.
+            pass
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def read_text(path: str) -> str:
     try:
-        return path.read_text(encoding="utf-8")
+        with open(path, encoding="utf-8") as handle:
+            return handle.read()
     except FileNotFoundError:
         return ""
     except OSError:
         return ""
 
 
+@lru_cache(maxsize=128)
 def normalize_status(raw: str | None, fallback: str = "backlog") -> str:
     if not raw:
         return fallback
@@ -79,73 +123,64 @@ def normalize_status(raw: str | None, fallback: str = "backlog") -> str:
     return fallback
 
 
-def parse_sprint_status(path: Path) -> Dict[str, str]:
-    text = read_text(path)
-    if not text:
+def parse_sprint_status(path: str) -> Dict[str, str]:
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+    except OSError:
+        data = b""
+    if not data:
         return {}
 
-    statuses: Dict[str, str] = {}
-    in_dev = False
-
-    for raw_line in text.splitlines():
-        line = raw_line.rstrip("\n")
-        stripped = line.strip()
-
-        if not in_dev:
-            if stripped == "development_status:":
-                in_dev = True
-            continue
-
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        if not line.startswith("  "):
-            break
+    block = SPRINT_BLOCK_RE.search(data)
+    if not block:
+        return {}
 
-        match = re.match(r"^\s{2}([a-z0-9-]+):\s*([a-z-]+)\s*$", line)
-        if not match:
-            continue
-        key, value = match.group(1), match.group(2)
-        statuses[key] = normalize_status(value, fallback=value)
+    statuses: Dict[str, str] = {}
+    # Keys and values are ASCII by construction of the entry pattern.
+    for raw_key, raw_value in SPRINT_ENTRY_RE.findall(block.group(1)):
+        value = raw_value.decode("ascii")
+        statuses[raw_key.decode("ascii")] = normalize_status(value, value)
 
     return statuses
 
 
-def parse_epic_and_story_titles(files: List[Path]) -> Tuple[Dict[int, str], Dict[str, str]]:
+def parse_epic_and_story_titles(files: List[str]) -> Tuple[Dict[int, str], Dict[str, str]]:
     epic_titles: Dict[int, str] = {}
     story_titles: Dict[str, str] = {}
-    current_epic: int | None = None
 
     for file_path in files:
         text = read_text(file_path)
         if not text:
             continue
 
-        for raw_line in text.splitlines():
-            line = raw_line.strip()
-
-            epic_match = EPIC_TITLE_RE.match(line)
-            if epic_match:
-                current_epic = int(epic_match.group(1))
-                epic_titles[current_epic] = epic_match.group(2).strip()
-                continue
-
-            story_match = STORY_LINE_RE.match(line)
-            if story_match:
-                epic = int(story_match.group(1))
-                story = int(story_match.group(2))
-                key = f"{epic}-{story}"
-                story_titles[key] = story_match.group(3).strip()
-                if current_epic is None:
-                    current_epic = epic
+        for match in TITLE_LINE_RE.finditer(text):
+            epic = match.group("epic")
+            if epic is not None:
+                epic_titles[int(epic)] = match.group("epic_title")
                 continue
+            key = f"{int(match.group('story_epic'))}-{int(match.group('story'))}"
+            story_titles[key] = match.group("story_title")
 
     return epic_titles, story_titles
 
 
-def parse_story_file(path: Path) -> ParsedStoryFile:
-    text = read_text(path)
-    if not text:
+def count_checkboxes(data: bytes) -> Tuple[int, int]:
+    # Top-level "- [ ]" / "- [x]" items only: each must start the file or follow a newline.
+    unchecked = data.count(b"\n- [ ]") + data.startswith(b"- [ ]")
+    checked = data.count(b"\n- [x]") + data.count(b"\n- [X]") + data.startswith((b"- [x]", b"- [X]"))
+    return unchecked + checked, checked
+
+
+def parse_story_file(path: str, mtime: float | None = None) -> ParsedStoryFile:
+    try:
+        with open(path, "rb") as handle:
+            data = handle.read()
+            if mtime is None:
+                mtime = os.fstat(handle.fileno()).st_mtime
+    except OSError:
+        data = b""
+    if not data:
         return ParsedStoryFile(
             title=None,
             status=None,
@@ -154,29 +189,23 @@ def parse_story_file(path: Path) -> ParsedStoryFile:
             updated_at=None,
         )
 
+    # Title and status live at the top of a story; only checkboxes need the whole file.
     title: str | None = None
-    status: str | None = None
+    title_match = STORY_FILE_TITLE_RE.search(data, 0, HEADER_SCAN_BYTES)
+    if title_match:
+        title = title_match.group(1).decode("utf-8", errors="replace").strip()
 
-    for raw_line in text.splitlines():
-        if title is None:
-            title_match = STORY_FILE_TITLE_RE.match(raw_line.strip())
-            if title_match:
-                title = title_match.group(1).strip()
-                continue
-        if status is None:
-            status_match = STATUS_LINE_RE.match(raw_line.strip())
-            if status_match:
-                status = normalize_status(status_match.group(1), fallback="backlog")
-        if title is not None and status is not None:
-            break
+    status: str | None = None
+    status_match = STATUS_LINE_RE.search(data, 0, HEADER_SCAN_BYTES)
+    if status_match:
+        status = normalize_status(status_match.group(1).decode("utf-8", errors="replace"), "backlog")
 
-    checklist_total = len(CHECKBOX_TOTAL_RE.findall(text))
-    checklist_done = len(CHECKBOX_DONE_RE.findall(text))
+    checklist_total, checklist_done = count_checkboxes(data)
 
     updated_at: str | None = None
     try:
-        updated_at = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc).isoformat()
-    except OSError:
+        updated_at = datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
+    except (OSError, OverflowError, ValueError):
         updated_at = None
 
     return ParsedStoryFile(
@@ -188,32 +217,70 @@ def parse_story_file(path: Path) -> ParsedStoryFile:
     )
 
 
+def parse_story_files(paths: List[str], mtimes: List[float | None]) -> List[ParsedStoryFile]:
+    if len(paths) < PARALLEL_PARSE_MIN_FILES:
+        return [parse_story_file(path, mtime) for path, mtime in zip(paths, mtimes)]
+    return list(_PARSE_EXECUTOR.map(parse_story_file, paths, mtimes))
+
+
+def scan_story_files(impl_dir: str) -> Dict[str, os.DirEntry]:
+    story_files: Dict[str, os.DirEntry] = {}
+    try:
+        with os.scandir(impl_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".md") and entry.is_file():
+                    story_files[entry.name[:-3]] = entry
+    except OSError:
+        pass
+    return story_files
+
+
+def entry_mtime(entry: os.DirEntry | None) -> float | None:
+    if entry is None:
+        return None
+    try:
+        return entry.stat().st_mtime
+    except OSError:
+        return None
+
+
+def split_story_key(story_key: str) -> Tuple[int, int, str] | None:
+    parts = story_key.split("-", 2)
+    if len(parts) != 3:
+        return None
+    epic, story, slug = parts
+    if not (epic.isdecimal() and story.isdecimal()) or not slug or slug.strip(STORY_SLUG_CHARS):
+        return None
+    return int(epic), int(story), slug
+
+
+@lru_cache(maxsize=512)
 def title_from_story_key(story_key: str) -> str:
-    story_match = STORY_KEY_RE.match(story_key)
-    if not story_match:
+    story_parts = split_story_key(story_key)
+    if not story_parts:
         return story_key
-    slug = story_match.group(3)
+    slug = story_parts[2]
     return slug.replace("-", " ").strip().title()
 
 
-def resolve_output_path(query_output: str | None) -> Path:
+def resolve_output_path(query_output: str | None) -> str:
     if not query_output:
         return DEFAULT_BMAD_OUTPUT
     raw = query_output.strip()
     if not raw:
         return DEFAULT_BMAD_OUTPUT
-    candidate = Path(raw).expanduser()
-    if not candidate.is_absolute():
-        candidate = (WORKSPACE_ROOT / candidate).resolve()
-    return candidate
+    candidate = os.path.expanduser(raw)
+    if not os.path.isabs(candidate):
+        candidate = os.path.join(WORKSPACE_ROOT, candidate)
+    return os.path.normpath(candidate)
 
 
-def build_board_data(output_dir: Path) -> Dict[str, object]:
-    impl_dir = output_dir / "implementation-artifacts"
-    planning_dir = output_dir / "planning-artifacts"
-    sprint_status_file = impl_dir / "sprint-status.yaml"
-    epic_visual_file = planning_dir / "epics-stories-visualization.md"
-    epics_file = planning_dir / "epics.md"
+def build_board_data(output_dir: str) -> Dict[str, object]:
+    impl_dir = os.path.join(output_dir, "implementation-artifacts")
+    planning_dir = os.path.join(output_dir, "planning-artifacts")
+    sprint_status_file = os.path.join(impl_dir, "sprint-status.yaml")
+    epic_visual_file = os.path.join(planning_dir, "epics-stories-visualization.md")
+    epics_file = os.path.join(planning_dir, "epics.md")
 
     statuses = parse_sprint_status(sprint_status_file)
     epic_titles, story_titles = parse_epic_and_story_titles([epic_visual_file, epics_file])
@@ -222,49 +289,74 @@ def build_board_data(output_dir: Path) -> Dict[str, object]:
     story_entries: List[Dict[str, object]] = []
     warnings: List[str] = []
 
-    if not output_dir.exists():
+    if not os.path.exists(output_dir):
         warnings.append(f"Output path does not exist: {output_dir}")
-    if not sprint_status_file.exists():
+    if not os.path.exists(sprint_status_file):
         warnings.append(f"sprint-status.yaml not found: {sprint_status_file}")
 
     story_keys_in_status = set()
     epic_keys_in_status = set()
+    story_files = scan_story_files(impl_dir)
+    # (key, epic_number, story_number, story_file, status_from_sprint)
+    story_rows: List[Tuple[str, int, int, str, str | None]] = []
 
     for key, value in statuses.items():
-        epic_match = EPIC_KEY_RE.match(key)
-        if epic_match:
-            epic_number = int(epic_match.group(1))
+        epic_suffix = key[len(EPIC_KEY_PREFIX):]
+        if key.startswith(EPIC_KEY_PREFIX) and epic_suffix.isdecimal():
+            epic_number = int(epic_suffix)
             epic_keys_in_status.add(key)
             epic_entries.append(
                 {
                     "key": key,
                     "number": epic_number,
                     "title": epic_titles.get(epic_number, f"Epic {epic_number}"),
-                    "status": normalize_status(value, fallback="backlog"),
+                    "status": normalize_status(value, "backlog"),
                 }
             )
             continue
 
-        story_match = STORY_KEY_RE.match(key)
-        if not story_match:
+        story_parts = split_story_key(key)
+        if not story_parts:
             continue
 
-        epic_number = int(story_match.group(1))
-        story_number = int(story_match.group(2))
-        compact_story_key = f"{epic_number}-{story_number}"
-        story_file = impl_dir / f"{key}.md"
-        parsed = parse_story_file(story_file)
+        story_keys_in_status.add(key)
+        story_rows.append(
+            (
+                key,
+                story_parts[0],
+                story_parts[1],
+                os.path.join(impl_dir, f"{key}.md"),
+                normalize_status(value, "backlog"),
+            )
+        )
 
-        mapped_status = normalize_status(value, fallback="backlog")
-        effective_status = mapped_status
-        file_status = parsed.status
-        status_mismatch = bool(file_status and file_status != mapped_status)
+    # Include story files that are present but missing in sprint-status
+    for story_key in sorted(story_files):
+        story_parts = split_story_key(story_key)
+        if not story_parts or story_key in story_keys_in_status:
+            continue
+        file_path = story_files[story_key].path
+        story_rows.append((story_key, story_parts[0], story_parts[1], file_path, None))
 
-        if key not in story_keys_in_status:
-            story_keys_in_status.add(key)
+    parsed_files = parse_story_files(
+        [row[3] for row in story_rows],
+        [entry_mtime(story_files.get(row[0])) for row in story_rows],
+    )
 
+    for (key, epic_number, story_number, story_file, mapped_status), parsed in zip(story_rows, parsed_files):
+        compact_story_key = f"{epic_number}-{story_number}"
         title = story_titles.get(compact_story_key) or parsed.title or title_from_story_key(key)
 
+        file_status = parsed.status
+        if mapped_status is None:
+            status = normalize_status(file_status or "backlog", "backlog")
+            status_mismatch = False
+            file_exists = True
+        else:
+            status = mapped_status
+            status_mismatch = bool(file_status and file_status != mapped_status)
+            file_exists = key in story_files
+
         story_entries.append(
             {
                 "key": key,
@@ -272,58 +364,27 @@ def build_board_data(output_dir: Path) -> Dict[str, object]:
                 "story_number": story_number,
                 "display_number": f"{epic_number}.{story_number}",
                 "title": title,
-                "status": effective_status,
+                "status": status,
                 "status_from_sprint": mapped_status,
                 "status_from_file": file_status,
                 "status_mismatch": status_mismatch,
-                "file_path": str(story_file),
-                "file_exists": story_file.exists(),
+                "file_path": story_file,
+                "file_exists": file_exists,
                 "updated_at": parsed.updated_at,
                 "checklist_done": parsed.checklist_done,
                 "checklist_total": parsed.checklist_total,
             }
         )
 
-    # Include story files that are present but missing in sprint-status
-    if impl_dir.exists():
-        for file_path in sorted(impl_dir.glob("*.md")):
-            story_key = file_path.stem
-            match = STORY_KEY_RE.match(story_key)
-            if not match or story_key in story_keys_in_status:
-                continue
-
-            epic_number = int(match.group(1))
-            story_number = int(match.group(2))
-            compact_story_key = f"{epic_number}-{story_number}"
-            parsed = parse_story_file(file_path)
-            fallback_status = parsed.status or "backlog"
-            title = story_titles.get(compact_story_key) or parsed.title or title_from_story_key(story_key)
-
-            story_entries.append(
-                {
-                    "key": story_key,
-                    "epic_number": epic_number,
-                    "story_number": story_number,
-                    "display_number": f"{epic_number}.{story_number}",
-                    "title": title,
-                    "status": normalize_status(fallback_status, fallback="backlog"),
-                    "status_from_sprint": None,
-                    "status_from_file": parsed.status,
-                    "status_mismatch": False,
-                    "file_path": str(file_path),
-                    "file_exists": True,
-                    "updated_at": parsed.updated_at,
-                    "checklist_done": parsed.checklist_done,
-                    "checklist_total": parsed.checklist_total,
-                }
-            )
+    stories_by_epic: Dict[int, List[Dict[str, object]]] = defaultdict(list)
+    for story in story_entries:
+        stories_by_epic[int(story["epic_number"])].append(story)
 
     epic_map: Dict[int, Dict[str, object]] = {}
     for epic in epic_entries:
         epic_map[int(epic["number"])] = dict(epic)
 
-    for story in story_entries:
-        number = int(story["epic_number"])
+    for number in stories_by_epic:
         if number not in epic_map:
             epic_map[number] = {
                 "key": f"epic-{number}",
@@ -335,12 +396,19 @@ def build_board_data(output_dir: Path) -> Dict[str, object]:
     epic_progress: List[Dict[str, object]] = []
     for epic_number in sorted(epic_map.keys()):
         epic = epic_map[epic_number]
-        stories = [s for s in story_entries if int(s["epic_number"]) == epic_number]
+        stories = stories_by_epic.get(epic_number, [])
         total = len(stories)
-        done = sum(1 for s in stories if s["status"] == "done")
-        in_progress = sum(1 for s in stories if s["status"] == "in-progress")
-        review = sum(1 for s in stories if s["status"] == "review")
-        backlog = sum(1 for s in stories if s["status"] in {"backlog", "ready-for-dev"})
+        done = in_progress = review = backlog = 0
+        for story in stories:
+            status = story["status"]
+            if status == "done":
+                done += 1
+            elif status == "in-progress":
+                in_progress += 1
+            elif status == "review":
+                review += 1
+            elif status == "backlog" or status == "ready-for-dev":
+                backlog += 1
         progress = int((done / total) * 100) if total else 0
 
         epic_progress.append(
@@ -362,19 +430,22 @@ def build_board_data(output_dir: Path) -> Dict[str, object]:
     epic_progress.sort(key=lambda e: int(e["number"]))
 
     stories_by_status: Dict[str, int] = {status: 0 for status in STORY_STATUS_ORDER}
+    status_mismatch_count = 0
+    missing_file_count = 0
     for story in story_entries:
         status = str(story["status"])
         stories_by_status[status] = stories_by_status.get(status, 0) + 1
-
-    status_mismatch_count = sum(1 for s in story_entries if s["status_mismatch"])
-    missing_file_count = sum(1 for s in story_entries if not s["file_exists"])
+        if story["status_mismatch"]:
+            status_mismatch_count += 1
+        if not story["file_exists"]:
+            missing_file_count += 1
 
     return {
         "generated_at": now_iso(),
-        "workspace_root": str(WORKSPACE_ROOT),
-        "bmad_root": str(DEFAULT_BMAD),
-        "bmad_output": str(output_dir),
-        "sprint_status_file": str(sprint_status_file),
+        "workspace_root": WORKSPACE_ROOT,
+        "bmad_root": DEFAULT_BMAD,
+        "bmad_output": output_dir,
+        "sprint_status_file": sprint_status_file,
         "story_count": len(story_entries),
         "epic_count": len(epic_progress),
         "stories_by_status": stories_by_status,
@@ -386,9 +457,131 @@ def build_board_data(output_dir: Path) -> Dict[str, object]:
     }
 
 
+_BOARD_CACHE: "OrderedDict[Tuple[object, ...], CachedBoard]" = OrderedDict()
+_BOARD_CACHE_LOCK = threading.Lock()
+
+
+def stat_signature(path: str) -> Tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def board_cache_key(output_dir: str) -> Tuple[object, ...]:
+    impl_dir = os.path.join(output_dir, "implementation-artifacts")
+    planning_dir = os.path.join(output_dir, "planning-artifacts")
+
+    # Directory mtimes only change on create/delete/rename, so in-place edits
+    # to story files are tracked through their own mtimes.
+    story_files: List[Tuple[str, int, int]] = []
+    try:
+        with os.scandir(impl_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                story_files.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+        pass
+    story_files.sort()
+
+    return (
+        output_dir,
+        stat_signature(output_dir),
+        stat_signature(impl_dir),
+        stat_signature(planning_dir),
+        stat_signature(os.path.join(impl_dir, "sprint-status.yaml")),
+        stat_signature(os.path.join(planning_dir, "epics-stories-visualization.md")),
+        stat_signature(os.path.join(planning_dir, "epics.md")),
+        tuple(story_files),
+    )
+
+
+def get_cached_board(output_dir: str) -> CachedBoard:
+    key = board_cache_key(output_dir)
+    with _BOARD_CACHE_LOCK:
+        board = _BOARD_CACHE.get(key)
+        if board is not None:
+            _BOARD_CACHE.move_to_end(key)
+            return board
+
+    data = build_board_data(output_dir)
+    content = encode_json(data)
+    board = CachedBoard(
+        content=content,
+        gzip_content=gzip.compress(content, compresslevel=GZIP_LEVEL),
+    )
+    with _BOARD_CACHE_LOCK:
+        _BOARD_CACHE[key] = board
+        while len(_BOARD_CACHE) > BOARD_CACHE_SIZE:
+            _BOARD_CACHE.popitem(last=False)
+    return board
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    # An explicit gzip entry wins over the wildcard, regardless of order.
+    gzip_quality: float | None = None
+    wildcard_quality: float | None = None
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if coding not in {"gzip", "*"}:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value.strip())
+                except ValueError:
+                    quality = 0.0
+        if coding == "gzip":
+            gzip_quality = quality
+        else:
+            wildcard_quality = quality
+    if gzip_quality is not None:
+        return gzip_quality > 0
+    return wildcard_quality is not None and wildcard_quality > 0
+
+
+_HTML_BYTES: bytes | None = None
+_HTML_MTIME: int = 0
+_HTML_LOCK = threading.Lock()
+
+
+def get_html_bytes() -> bytes:
+    global _HTML_BYTES, _HTML_MTIME
+    try:
+        mtime = os.stat(HTML_PATH).st_mtime_ns
+    except OSError:
+        return b""
+    with _HTML_LOCK:
+        if _HTML_BYTES is None or mtime != _HTML_MTIME:
+            try:
+                with open(HTML_PATH, "rb") as handle:
+                    _HTML_BYTES = handle.read()
+            except OSError:
+                return b""
+            _HTML_MTIME = mtime
+        return _HTML_BYTES
+
+
 class BMADLiveBoardHandler(BaseHTTPRequestHandler):
+    # Keep-alive lets a polling dashboard reuse one connection (and one server
+    # thread) instead of opening a new one per refresh; idle sockets time out.
+    protocol_version = "HTTP/1.1"
+    timeout = KEEPALIVE_TIMEOUT_SECONDS
+    # Headers and body go out as separate writes; without TCP_NODELAY the body
+    # waits on the client's delayed ACK (~40 ms per response on keep-alive).
+    disable_nagle_algorithm = True
+
     def _send_json(self, payload: Dict[str, object], status: int = HTTPStatus.OK) -> None:
-        content = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        content = encode_json(payload)
         self.send_response(status)
         self.send_header("Content-Type", "application/json; charset=utf-8")
         self.send_header("Content-Length", str(len(content)))
@@ -396,8 +589,23 @@ class BMADLiveBoardHandler(BaseHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(content)
 
+    def _send_precomputed_json(self, content: bytes, gzip_content: bytes) -> None:
+        use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        body = gzip_content if use_gzip else content
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
     def _send_html(self, html: str, status: int = HTTPStatus.OK) -> None:
-        content = html.encode("utf-8")
+        self._send_html_bytes(html.encode("utf-8"), status=status)
+
+    def _send_html_bytes(self, content: bytes, status: int = HTTPStatus.OK) -> None:
         self.send_response(status)
         self.send_header("Content-Type", "text/html; charset=utf-8")
         self.send_header("Content-Length", str(len(content)))
@@ -411,18 +619,18 @@ class BMADLiveBoardHandler(BaseHTTPRequestHandler):
         parsed = urlparse(self.path)
 
         if parsed.path in {"/", "/index.html", "/bmad-local-dashboard.html"}:
-            html = read_text(HTML_PATH)
+            html = get_html_bytes()
             if not html:
                 self._send_html("<h1>Dashboard file not found</h1>", status=HTTPStatus.NOT_FOUND)
                 return
-            self._send_html(html)
+            self._send_html_bytes(html)
             return
 
         if parsed.path == "/api/board":
             params = parse_qs(parsed.query)
             output_dir = resolve_output_path(params.get("output", [None])[0])
-            data = build_board_data(output_dir)
-            self._send_json(data)
+            board = get_cached_board(output_dir)
+            self._send_precomputed_json(board.content, board.gzip_content)
             return
 
         self._send_not_found()